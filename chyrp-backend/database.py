@@ -1,5 +1,5 @@
 # database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -7,6 +7,17 @@ DATABASE_URL = "sqlite:///./blog.db"
 
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
+# pysqlite defers BEGIN until the first DML statement, so a SAVEPOINT issued
+# before any write would open (and its RELEASE would commit) the outer
+# transaction. Take over transaction control so savepoints nest properly.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
\ No newline at end of file
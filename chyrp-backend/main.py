@@ -12,7 +12,7 @@ from typing import List, Optional
 from fastapi import Depends, FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import JSON
 # --- Import from our custom files ---
 import models
@@ -26,7 +26,7 @@ from dependencies import (
     verify_password,
     require_post_permission # <-- ADD THIS IMPORT
 )
-from routers import interactions
+from routers import feeds, interactions, taxonomy
 
 # ===============================================================================
 # 1. FASTAPI APP INITIALIZATION & MIDDLEWARE
@@ -58,9 +58,15 @@ app.add_middleware(
 
 # --- Include Routers from other files ---
 app.include_router(interactions.router)
+app.include_router(taxonomy.router)
+app.include_router(feeds.router)
 
 # --- Create Database Tables on Startup ---
 models.Base.metadata.create_all(bind=engine)
+# create_all skips tables that already exist along with their indexes, so
+# indexes added to existing tables are created explicitly.
+for index in models.Post.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
 
 # ===============================================================================
 # 2. STARTUP EVENT (DATABASE SEEDING)
@@ -157,15 +163,16 @@ def create_post(post: schemas.PostCreate, db: Session = Depends(get_db), current
     if existing:
         raise HTTPException(status_code=400, detail="A post with this slug already exists.")
 
-    db_post = models.Post(**post.dict(), user_id=current_user.id)
+    db_post = models.Post(**post.dict(exclude={"tags", "category"}), user_id=current_user.id)
     db.add(db_post)
+    taxonomy.set_post_taxonomy(db, db_post, tags=post.tags, category=post.category, was_public=False)
     db.commit()
     db.refresh(db_post)
     return db_post
 
 @app.get("/posts/", response_model=List[schemas.PostModel], tags=["Posts"])
 def read_posts(content_type: Optional[str] = None, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    query = db.query(models.Post)
+    query = db.query(models.Post).options(selectinload(models.Post.tags), selectinload(models.Post.category))
     if content_type:
         query = query.filter(models.Post.content_type == content_type)
     posts = query.offset(skip).limit(limit).all()
@@ -173,7 +180,9 @@ def read_posts(content_type: Optional[str] = None, skip: int = 0, limit: int = 1
 
 @app.get("/posts/{post_id}", response_model=schemas.PostModel, tags=["Posts"])
 def read_post(post_id: int, db: Session = Depends(get_db)):
-    db_post = db.query(models.Post).filter(models.Post.id == post_id).first()
+    db_post = db.query(models.Post).options(
+        selectinload(models.Post.tags), selectinload(models.Post.category)
+    ).filter(models.Post.id == post_id).first()
     if db_post is None:
         raise HTTPException(status_code=404, detail="Post not found")
     return db_post
@@ -187,8 +196,13 @@ def update_post(
 ):
     # The dependency already verified permissions and fetched the post.
     # We can now safely update it.
-    for key, value in post_update.dict(exclude_unset=True).items():
+    update_data = post_update.dict(exclude_unset=True)
+    was_public = db_post.status == "public"
+    tags = update_data.pop("tags", None)
+    category = update_data.pop("category", None)
+    for key, value in update_data.items():
         setattr(db_post, key, value)
+    taxonomy.set_post_taxonomy(db, db_post, tags=tags, category=category, was_public=was_public)
     
     db_post.updated_at = datetime.datetime.utcnow()
     db.commit()
@@ -203,6 +217,7 @@ def delete_post(
 ):
     # The dependency already verified permissions and fetched the post.
     # We can now safely delete it.
+    taxonomy.clear_post_taxonomy(db, db_post)
     db.delete(db_post)
     db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,7 @@
 # models.py
 
-from sqlalchemy import (Column, DateTime, ForeignKey, Integer, String, Table,
-                        JSON)
+from sqlalchemy import (Column, DateTime, ForeignKey, Index, Integer, String,
+                        Table, JSON)
 from sqlalchemy.orm import relationship
 from database import Base
 import datetime
@@ -23,6 +23,23 @@ favorite_writers_association = Table('favorite_writers', Base.metadata,
     Column('favorite_user_id', Integer, ForeignKey('users.id'), primary_key=True)
 )
 
+# --- Taxonomy Association Tables ---
+# The primary key covers post -> tag lookups; the reverse index covers
+# tag -> post scans so listing by tag never touches the posts table first.
+
+post_tags_association = Table('post_tags', Base.metadata,
+    Column('post_id', Integer, ForeignKey('posts.id'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    Index('ix_post_tags_tag_id_post_id', 'tag_id', 'post_id'),
+)
+
+# A post belongs to at most one category, so post_id alone is the key.
+post_categories_association = Table('post_categories', Base.metadata,
+    Column('post_id', Integer, ForeignKey('posts.id'), primary_key=True),
+    Column('category_id', Integer, ForeignKey('categories.id'), nullable=False),
+    Index('ix_post_categories_category_id_post_id', 'category_id', 'post_id'),
+)
+
 # --- Main Database Models ---
 
 class Group(Base):
@@ -66,6 +83,13 @@ class User(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    # Feeds read the newest public posts, optionally narrowed by feather or
+    # author. Trailing updated_at lets the feed validator run off the index.
+    __table_args__ = (
+        Index('ix_posts_feed', 'content_type', 'status', 'created_at', 'updated_at'),
+        Index('ix_posts_feed_feather', 'feather', 'content_type', 'status', 'created_at', 'updated_at'),
+        Index('ix_posts_feed_user', 'user_id', 'content_type', 'status', 'created_at', 'updated_at'),
+    )
     id = Column(Integer, primary_key=True, index=True)
     content_type = Column(String, default="post", index=True)
     feather = Column(String, nullable=True)
@@ -85,3 +109,25 @@ class Post(Base):
     
     liked_by_users = relationship("User", secondary=post_likes_association, back_populates="liked_posts")
     bookmarked_by_users = relationship("User", secondary=post_bookmarks_association, back_populates="bookmarked_posts")
+
+    tags = relationship("Tag", secondary=post_tags_association, back_populates="posts")
+    category = relationship("Category", secondary=post_categories_association, uselist=False, back_populates="posts")
+
+class Tag(Base):
+    __tablename__ = "tags"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String)
+    slug = Column(String, unique=True, index=True)
+    # Maintained on every tag change so the tag cloud never aggregates.
+    post_count = Column(Integer, default=0, nullable=False, index=True)
+
+    posts = relationship("Post", secondary=post_tags_association, back_populates="tags")
+
+class Category(Base):
+    __tablename__ = "categories"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String)
+    slug = Column(String, unique=True, index=True)
+    post_count = Column(Integer, default=0, nullable=False)
+
+    posts = relationship("Post", secondary=post_categories_association, back_populates="category")
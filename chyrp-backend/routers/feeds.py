@@ -0,0 +1,272 @@
+# routers/feeds.py
+
+import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session, joinedload
+
+from dependencies import get_db
+from models import Post, User
+
+router = APIRouter(
+    tags=["Feeds"],
+)
+
+SITE_URL = "http://localhost:5173"
+API_URL = "http://localhost:8000"
+SITE_TITLE = "Chyrp Clone"
+FEED_SIZE = 20
+# Rendered feeds kept per process. Every request still runs the validator
+# query, so a worker never serves a body another worker's write made stale.
+FEED_CACHE_SIZE = 64
+FEATHERS = ("text", "photo", "quote", "link")
+
+# Columns that appear in a rendered feed; other post changes (likes,
+# bookmarks, taxonomy) leave the cache alone.
+FEED_COLUMNS = (
+    "title", "body", "clean", "status", "feather", "content_type",
+    "user_id", "created_at", "updated_at",
+)
+
+MEDIA_TYPES = {
+    "atom": "application/atom+xml; charset=utf-8",
+    "rss": "application/rss+xml; charset=utf-8",
+}
+
+# --- Rendered Feed Cache ---
+# An LRU of (format, scope) -> (etag, last_modified, body). Flushes that touch
+# feed content mark the session, and the cache is cleared once that session
+# commits. The generation counter stops a render that raced with a commit
+# from storing a stale copy. Endpoints and stream() run in the threadpool,
+# so every access goes through _lock.
+
+_cache: "OrderedDict[Tuple[str, str], Tuple[str, datetime.datetime, bytes]]" = OrderedDict()
+_generation = 0
+_lock = threading.Lock()
+
+def invalidate_feed_cache():
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.clear()
+
+def _cache_get(key):
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+        return cached, _generation
+
+def _cache_put(key, value, generation: int):
+    """Stores a rendered feed unless the cache was invalidated since generation."""
+    with _lock:
+        if generation != _generation:
+            return
+        _cache[key] = value
+        _cache.move_to_end(key)
+        while len(_cache) > FEED_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def _changes_feed(obj) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in FEED_COLUMNS)
+
+@event.listens_for(Session, "after_flush")
+def _mark_post_write(session, flush_context):
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Post):
+            session.info["feeds_stale"] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, Post) and _changes_feed(obj):
+            session.info["feeds_stale"] = True
+            return
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_post_commit(session):
+    if session.info.pop("feeds_stale", False):
+        invalidate_feed_cache()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_post_write(session):
+    session.info.pop("feeds_stale", None)
+
+# --- Conditional Request Helpers ---
+
+def _http_date(value: datetime.datetime) -> str:
+    return format_datetime(value.replace(tzinfo=datetime.timezone.utc), usegmt=True)
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime.datetime]) -> bool:
+    """Applies If-None-Match, falling back to If-Modified-Since when it is absent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        # HTTP dates only carry whole seconds.
+        newest = last_modified.replace(tzinfo=datetime.timezone.utc, microsecond=0)
+        return newest <= since
+    return False
+
+def _validator_headers(etag: str, last_modified: Optional[datetime.datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+# --- XML Rendering ---
+
+def _post_url(post: Post) -> str:
+    return f"{SITE_URL}/posts/{post.id}"
+
+def _post_title(post: Post) -> str:
+    return post.title or post.clean
+
+def _render_atom(title: str, self_url: str, updated: Optional[datetime.datetime], posts: List[Post]) -> Iterator[str]:
+    updated = updated or datetime.datetime.utcnow()
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+    yield f"<title>{escape(title)}</title>\n"
+    yield f"<id>{escape(self_url)}</id>\n"
+    yield f'<link rel="self" href="{escape(self_url)}"/>\n'
+    yield f'<link rel="alternate" href="{SITE_URL}/"/>\n'
+    yield f"<updated>{updated.isoformat()}Z</updated>\n"
+    for post in posts:
+        author = (post.owner.full_name or post.owner.login) if post.owner else SITE_TITLE
+        yield (
+            "<entry>\n"
+            f"<title>{escape(_post_title(post))}</title>\n"
+            f"<id>{_post_url(post)}</id>\n"
+            f'<link rel="alternate" href="{_post_url(post)}"/>\n'
+            f"<published>{post.created_at.isoformat()}Z</published>\n"
+            f"<updated>{post.updated_at.isoformat()}Z</updated>\n"
+            f"<author><name>{escape(author)}</name></author>\n"
+            f'<content type="text">{escape(post.body or "")}</content>\n'
+            "</entry>\n"
+        )
+    yield "</feed>\n"
+
+def _render_rss(title: str, self_url: str, updated: Optional[datetime.datetime], posts: List[Post]) -> Iterator[str]:
+    updated = updated or datetime.datetime.utcnow()
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n<channel>\n'
+    yield f"<title>{escape(title)}</title>\n"
+    yield f"<link>{SITE_URL}/</link>\n"
+    yield f"<description>{escape(title)}</description>\n"
+    yield f'<atom:link rel="self" href="{escape(self_url)}" type="application/rss+xml"/>\n'
+    yield f"<lastBuildDate>{_http_date(updated)}</lastBuildDate>\n"
+    for post in posts:
+        yield (
+            "<item>\n"
+            f"<title>{escape(_post_title(post))}</title>\n"
+            f"<link>{_post_url(post)}</link>\n"
+            f'<guid isPermaLink="true">{_post_url(post)}</guid>\n'
+            f"<pubDate>{_http_date(post.created_at)}</pubDate>\n"
+            f"<description>{escape(post.body or '')}</description>\n"
+            "</item>\n"
+        )
+    yield "</channel>\n</rss>\n"
+
+RENDERERS = {"atom": _render_atom, "rss": _render_rss}
+
+# --- Feed Response ---
+
+def _feed_response(request: Request, db: Session, fmt: str, scope: str, title: str, path: str, *filters):
+    """
+    Serves a feed of the newest public posts matching filters.
+    A count/max(updated_at) aggregate over the covering feed index yields the
+    ETag on every request; a cached body with the same ETag is served as-is.
+
+    Last-Modified is when this process first saw the current ETag rather than
+    max(updated_at), which stays put or goes back when posts are deleted or
+    unpublished. A miss can only move it forward.
+    """
+    key = (fmt, scope)
+    base_query = db.query(Post).filter(
+        Post.content_type == "post",
+        Post.status == "public",
+        *filters,
+    )
+    count, newest = base_query.with_entities(func.count(Post.id), func.max(Post.updated_at)).one()
+    digest = hashlib.sha1(f"{fmt}:{scope}:{count}:{newest}".encode()).hexdigest()
+    etag = f'"{digest}"'
+
+    cached, generation = _cache_get(key)
+    if cached is not None and cached[0] == etag:
+        last_modified, body = cached[1], cached[2]
+    else:
+        body = None
+        last_modified = datetime.datetime.utcnow().replace(microsecond=0)
+
+    headers = _validator_headers(etag, last_modified)
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if body is not None:
+        return Response(content=body, media_type=MEDIA_TYPES[fmt], headers=headers)
+
+    # Load the page up front; the session is closed before streaming finishes.
+    posts = (
+        base_query.options(joinedload(Post.owner))
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(FEED_SIZE)
+        .all()
+    )
+    # The body is shared by every client, so never build it from request headers.
+    chunks = RENDERERS[fmt](title, f"{API_URL}{path}", newest, posts)
+
+    def stream():
+        rendered = []
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            rendered.append(data)
+            yield data
+        _cache_put(key, (etag, last_modified, b"".join(rendered)), generation)
+
+    return StreamingResponse(stream(), media_type=MEDIA_TYPES[fmt], headers=headers)
+
+# --- Feed Endpoints ---
+
+FORMAT = Path(..., pattern="^(atom|rss)$")
+FEATHER = Path(..., pattern=f"^({'|'.join(FEATHERS)})$")
+
+@router.get("/feed.{fmt}")
+def read_feed(request: Request, fmt: str = FORMAT, db: Session = Depends(get_db)):
+    """Site-wide feed of the newest public posts."""
+    return _feed_response(request, db, fmt, "all", SITE_TITLE, f"/feed.{fmt}")
+
+@router.get("/feathers/{feather}/feed.{fmt}")
+def read_feather_feed(request: Request, feather: str = FEATHER, fmt: str = FORMAT, db: Session = Depends(get_db)):
+    """Feed restricted to one feather (text, photo, quote or link)."""
+    return _feed_response(
+        request, db, fmt, f"feather:{feather}", f"{SITE_TITLE}: {feather} posts",
+        f"/feathers/{feather}/feed.{fmt}",
+        Post.feather == feather,
+    )
+
+@router.get("/users/{user_id}/feed.{fmt}")
+def read_user_feed(request: Request, user_id: int, fmt: str = FORMAT, db: Session = Depends(get_db)):
+    """Feed of one author's public posts."""
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return _feed_response(
+        request, db, fmt, f"user:{user_id}", f"{SITE_TITLE}: posts by {user.full_name or user.login}",
+        f"/users/{user_id}/feed.{fmt}",
+        Post.user_id == user_id,
+    )
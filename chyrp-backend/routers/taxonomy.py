@@ -0,0 +1,223 @@
+# routers/taxonomy.py
+
+import re
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import intersect, select, union
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from dependencies import get_db
+from models import Category, Post, Tag, post_categories_association, post_tags_association
+import schemas
+
+router = APIRouter(
+    tags=["Taxonomy"],
+)
+
+MAX_PAGE_SIZE = 100
+
+# --- Helpers used by the post endpoints in main.py ---
+
+# Symbols that distinguish otherwise identical names ("C", "C++", "C#").
+SLUG_SYMBOLS = {"+": " plus ", "#": " sharp "}
+
+def slugify(name: str) -> str:
+    """Normalizes a tag or category name into its URL slug, keeping Unicode letters."""
+    name = name.strip().lower()
+    for symbol, word in SLUG_SYMBOLS.items():
+        name = name.replace(symbol, word)
+    return re.sub(r"[\W_]+", "-", name).strip("-")
+
+def _get_or_create(db: Session, model, name: str):
+    slug = slugify(name)
+    if not slug:
+        raise HTTPException(status_code=400, detail=f"Invalid {model.__name__.lower()} name: {name!r}")
+    obj = db.query(model).filter(model.slug == slug).first()
+    if obj is None:
+        # Another request may insert the same slug first; the savepoint keeps
+        # the rest of this transaction usable so we can pick up its row.
+        try:
+            with db.begin_nested():
+                obj = model(name=name.strip(), slug=slug, post_count=0)
+                db.add(obj)
+        except IntegrityError:
+            obj = db.query(model).filter(model.slug == slug).one()
+    return obj
+
+def _is_public(post: Post) -> bool:
+    # Only public posts are counted, so unpublished tags never reach the cloud.
+    return post.status == "public"
+
+def set_post_taxonomy(
+    db: Session,
+    post: Post,
+    tags: Optional[List[str]] = None,
+    category: Optional[str] = None,
+    was_public: Optional[bool] = None,
+):
+    """
+    Updates a post's tags and category and keeps post_count in step.
+    None leaves tags or category unchanged, [] and "" clear them. Call it
+    after any status change, passing the status the post had before, so
+    every count gets a single net delta against the final visibility.
+    """
+    if was_public is None:
+        was_public = _is_public(post)
+    now_public = _is_public(post)
+
+    old_tags = {tag.id: tag for tag in post.tags}
+    new_tags = old_tags
+    if tags is not None:
+        new_tags = {}
+        for name in tags:
+            tag = _get_or_create(db, Tag, name)
+            new_tags[tag.id] = tag
+
+    for tag_id, tag in {**old_tags, **new_tags}.items():
+        delta = int(now_public and tag_id in new_tags) - int(was_public and tag_id in old_tags)
+        if delta:
+            tag.post_count = Tag.post_count + delta
+    if tags is not None:
+        post.tags = list(new_tags.values())
+
+    old_category = post.category
+    new_category = old_category
+    if category is not None:
+        new_category = _get_or_create(db, Category, category) if category else None
+
+    for item in {old_category, new_category} - {None}:
+        delta = int(now_public and item is new_category) - int(was_public and item is old_category)
+        if delta:
+            item.post_count = Category.post_count + delta
+    if new_category is not old_category:
+        post.category = new_category
+
+def clear_post_taxonomy(db: Session, post: Post):
+    """Releases a post's tags and category before it is deleted."""
+    set_post_taxonomy(db, post, tags=[], category="")
+
+# --- Internal Query Helpers ---
+
+def _lookup_ids(db: Session, model, slugs: List[str]) -> Tuple[List[int], int]:
+    """Returns the ids of the slugs that exist and how many distinct slugs were asked for."""
+    slugs = {slugify(slug) for slug in slugs}
+    rows = db.query(model.id).filter(model.slug.in_(slugs)).all()
+    return [row.id for row in rows], len(slugs)
+
+def _lookup_id(db: Session, model, slug: str) -> int:
+    ids, _ = _lookup_ids(db, model, [slug])
+    if not ids:
+        raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
+    return ids[0]
+
+def _page(db: Session, post_ids, limit: int):
+    """
+    Turns a selectable of post ids into a page of public posts, newest first.
+    The scans already apply the cursor, which is the last post id of the
+    previous page.
+    """
+    post_ids = post_ids.subquery()
+    id_query = (
+        select(post_ids.c.post_id)
+        .join(Post, Post.id == post_ids.c.post_id)
+        .where(Post.status == "public")
+        .order_by(post_ids.c.post_id.desc())
+        .limit(limit + 1)
+    )
+    ids = list(db.execute(id_query).scalars())
+
+    next_cursor = None
+    if len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = ids[-1]
+
+    posts = (
+        db.query(Post)
+        .options(selectinload(Post.owner), selectinload(Post.tags), selectinload(Post.category))
+        .filter(Post.id.in_(ids))
+        .order_by(Post.id.desc())
+        .all()
+    ) if ids else []
+    return {"items": posts, "next_cursor": next_cursor}
+
+def _tag_post_ids(tag_id: int, cursor: Optional[int]):
+    # Served entirely from the (tag_id, post_id) index.
+    query = select(post_tags_association.c.post_id).where(post_tags_association.c.tag_id == tag_id)
+    if cursor is not None:
+        query = query.where(post_tags_association.c.post_id < cursor)
+    return query
+
+# --- Tag Endpoints ---
+
+@router.get("/tags/", response_model=List[schemas.TagModel])
+def read_tag_cloud(limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    """Returns the most used tags, read straight from the maintained counts."""
+    return (
+        db.query(Tag)
+        .filter(Tag.post_count > 0)
+        .order_by(Tag.post_count.desc(), Tag.slug)
+        .limit(limit)
+        .all()
+    )
+
+@router.get("/tags/posts", response_model=schemas.PostPage)
+def read_posts_by_tags(
+    tag: List[str] = Query(...),
+    match: str = Query("all", pattern="^(all|any)$"),
+    cursor: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Lists posts carrying all (AND) or any (OR) of the given tag slugs.
+    Each tag contributes an indexed id scan which are then intersected or unioned.
+    Unknown tags empty an AND query and are skipped by an OR query.
+    """
+    tag_ids, requested = _lookup_ids(db, Tag, tag)
+    if match == "all" and len(tag_ids) < requested:
+        return {"items": [], "next_cursor": None}
+    if not tag_ids:
+        raise HTTPException(status_code=404, detail="Tag not found")
+    scans = [_tag_post_ids(tag_id, cursor) for tag_id in tag_ids]
+    if len(scans) == 1:
+        post_ids = scans[0]
+    elif match == "all":
+        post_ids = intersect(*scans)
+    else:
+        post_ids = union(*scans)
+    return _page(db, post_ids, limit)
+
+@router.get("/tags/{slug}/posts", response_model=schemas.PostPage)
+def read_posts_by_tag(
+    slug: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Lists posts carrying a single tag."""
+    tag_id = _lookup_id(db, Tag, slug)
+    return _page(db, _tag_post_ids(tag_id, cursor), limit)
+
+# --- Category Endpoints ---
+
+@router.get("/categories/", response_model=List[schemas.CategoryModel])
+def read_categories(db: Session = Depends(get_db)):
+    return db.query(Category).filter(Category.post_count > 0).order_by(Category.name).all()
+
+@router.get("/categories/{slug}/posts", response_model=schemas.PostPage)
+def read_posts_by_category(
+    slug: str,
+    cursor: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Lists posts in a category, served from the (category_id, post_id) index."""
+    category_id = _lookup_id(db, Category, slug)
+    query = select(post_categories_association.c.post_id).where(
+        post_categories_association.c.category_id == category_id
+    )
+    if cursor is not None:
+        query = query.where(post_categories_association.c.post_id < cursor)
+    return _page(db, query, limit)
@@ -11,6 +11,24 @@ class PostOwner(BaseModel):
     class Config:
         from_attributes = True
 
+# --- Pydantic Schemas for Tags/Categories ---
+
+class TagModel(BaseModel):
+    id: int
+    name: str
+    slug: str
+    post_count: int
+    class Config:
+        from_attributes = True
+
+class CategoryModel(BaseModel):
+    id: int
+    name: str
+    slug: str
+    post_count: int
+    class Config:
+        from_attributes = True
+
 # --- Pydantic Schemas for Posts/Pages ---
 
 class PostBase(BaseModel):
@@ -24,7 +42,8 @@ class PostBase(BaseModel):
     pinned: bool = False
 
 class PostCreate(PostBase):
-    pass
+    tags: List[str] = []
+    category: Optional[str] = None
 
 class PostUpdate(BaseModel):
     content_type: Optional[str] = None
@@ -35,15 +54,23 @@ class PostUpdate(BaseModel):
     clean: Optional[str] = None
     status: Optional[str] = None
     pinned: Optional[bool] = None
+    tags: Optional[List[str]] = None  # An empty list removes all tags
+    category: Optional[str] = None  # An empty string removes the category
 
 class PostModel(PostBase):
     id: int
     created_at: datetime.datetime
     updated_at: datetime.datetime
     owner: PostOwner # Now this works because PostOwner is defined above
+    tags: List[TagModel] = []
+    category: Optional[CategoryModel] = None
     class Config:
         from_attributes = True
 
+class PostPage(BaseModel):
+    items: List[PostModel]
+    next_cursor: Optional[int] = None
+
 # --- Pydantic Schemas for Groups ---
 
 class GroupBase(BaseModel):
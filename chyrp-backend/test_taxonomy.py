@@ -0,0 +1,65 @@
+# test_taxonomy.py
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import models
+from routers import taxonomy
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autoflush=False, bind=engine)()
+    user = models.User(login="writer", email="writer@example.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+def create_post(db, clean, status="public", tags=(), category=None):
+    post = models.Post(clean=clean, status=status, user_id=1)
+    db.add(post)
+    taxonomy.set_post_taxonomy(db, post, tags=list(tags), category=category, was_public=False)
+    db.commit()
+    return post
+
+def update_post(db, post, tags=None, category=None, **fields):
+    # Mirrors main.update_post: fields first, then taxonomy against the old status.
+    was_public = post.status == "public"
+    for key, value in fields.items():
+        setattr(post, key, value)
+    taxonomy.set_post_taxonomy(db, post, tags=tags, category=category, was_public=was_public)
+    db.commit()
+
+def counts(db, model):
+    return {item.slug: item.post_count for item in db.query(model).all()}
+
+def test_status_and_taxonomy_change_together(db):
+    create_post(db, "other", tags=["beta"], category="Other")
+    post = create_post(db, "post", tags=["alpha"], category="Dev")
+
+    update_post(db, post, status="draft", tags=["alpha", "beta"], category="Other")
+    assert counts(db, models.Tag) == {"alpha": 0, "beta": 1}
+    assert counts(db, models.Category) == {"dev": 0, "other": 1}
+
+    update_post(db, post, status="public", tags=["beta"])
+    assert counts(db, models.Tag) == {"alpha": 0, "beta": 2}
+    assert counts(db, models.Category) == {"dev": 0, "other": 2}
+
+    taxonomy.clear_post_taxonomy(db, post)
+    db.delete(post)
+    db.commit()
+    assert counts(db, models.Tag) == {"alpha": 0, "beta": 1}
+    assert counts(db, models.Category) == {"dev": 0, "other": 1}
+
+def test_slugs_keep_distinct_and_unicode_names(db):
+    create_post(db, "langs", tags=["C", "C++", "C#", "日本"])
+    assert sorted(counts(db, models.Tag)) == ["c", "c-plus-plus", "c-sharp", "日本"]
+    with pytest.raises(HTTPException):
+        create_post(db, "bad", tags=["!!!"])